@@ -3,21 +3,78 @@ import os
 import zipfile
 import xml.etree.ElementTree as ET
 import csv
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 import json
+import multiprocessing
 import re
+import sys
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+# Calculation reference patterns, compiled once at import. _ALL_RE captures the
+# ID in a different group per format so one pass can resolve every reference:
+#   [Calculation_1234567890123], @{1234567890123}, [1234567890123] (long numeric IDs)
+_ALL_RE = re.compile(r'\[Calculation_(\d+)\]|@\{(\d+)\}|\[(\d{10,})\]')
+# Cheap prefilter for the numeric-ID format: a '[' directly followed by a digit
+_NUMERIC_BRACKET_RE = re.compile(r'\[\d')
+
+# Output CSV column order to match sample; build_final_output emits rows
+# as OutputRow tuples in this order
+OUTPUT_COLUMNS = (
+    'Column ID',
+    'Column Name',
+    'Column Alias',
+    'Field Type',
+    'Connection Name',
+    'Connection Alias',
+    'datatype',
+    'role',
+    'Calculation Formula',
+    'Original Calculation',
+    'Calc Clean Status',
+    'Field Used in Worksheets',
+    'Worksheet Name',
+    'File Name'
+)
+
+# Field names are the snake_case form of OUTPUT_COLUMNS, e.g. 'Column ID' -> column_id
+OutputRow = namedtuple('OutputRow', [c.lower().replace(' ', '_') for c in OUTPUT_COLUMNS])
+
 # --- Core Extraction Functions ---
 
-def extract_twb_tree(path):
-    """Extract the TWB XML tree from a TWB or TWBX file"""
+@contextmanager
+def open_twb(path):
+    """Open the TWB XML stream of a TWB or TWBX file"""
     if path.lower().endswith('.twbx'):
         with zipfile.ZipFile(path, 'r') as zf:
-            twb = next(n for n in zf.namelist() if n.lower().endswith('.twb'))
-            with zf.open(twb) as f:
-                return ET.parse(f), os.path.basename(path)
-    return ET.parse(path), os.path.basename(path)
+            # Stream the member as it inflates rather than extracting it first
+            info = next((i for i in zf.infolist() if i.filename.lower().endswith('.twb')), None)
+            if info is None:
+                raise ValueError('no .twb member in archive')
+            with zf.open(info) as f:
+                yield f
+    else:
+        with open(path, 'rb') as f:
+            yield f
+
+
+def _make_id_replacer(calc_map, counter):
+    """Build an _ALL_RE.sub callback that swaps a calculation ID for its caption
+
+    counter is a [resolved, unresolved] list tallying the references seen.
+    """
+    def replace_id(match):
+        # Exactly one alternative matched; its group holds the ID
+        calc_id = match.group(match.lastindex)
+        if calc_id in calc_map:
+            counter[0] += 1
+            return f"[{calc_map[calc_id]}]"
+        counter[1] += 1
+        return match.group(0)
+    return replace_id
 
 
 def clean_calculation_formula(raw_formula, calc_map):
@@ -25,56 +82,29 @@ def clean_calculation_formula(raw_formula, calc_map):
     if not raw_formula:
         return raw_formula, "No Formula"
     
+    # A reference needs '[Calculation_', '@{' or '[' followed by a digit, so
+    # formulas that only reference named fields like [Sales] skip the substitution
+    if ('[Calculation_' not in raw_formula and '@{' not in raw_formula
+            and not _NUMERIC_BRACKET_RE.search(raw_formula)):
+        return raw_formula, "Success"
+    
     cleaned = raw_formula
     status = "Success"
-    replacements_made = 0
+    counts = [0, 0]  # resolved, unresolved
     
     try:
-        # Pattern 1: [Calculation_1234567890123] format
-        calc_pattern = r'\[Calculation_(\d+)\]'
-        
-        def replace_calc_id(match):
-            nonlocal replacements_made
-            calc_id = match.group(1)
-            if calc_id in calc_map:
-                replacements_made += 1
-                return f"[{calc_map[calc_id]}]"
-            return match.group(0)
-        
-        cleaned = re.sub(calc_pattern, replace_calc_id, cleaned)
-        
-        # Pattern 2: @{id} style references
-        at_pattern = r'@\{(\d+)\}'
-        
-        def replace_at_id(match):
-            nonlocal replacements_made
-            calc_id = match.group(1)
-            if calc_id in calc_map:
-                replacements_made += 1
-                return f"[{calc_map[calc_id]}]"
-            return match.group(0)
-        
-        cleaned = re.sub(at_pattern, replace_at_id, cleaned)
-        
-        # Pattern 3: Direct numeric references [1234567890123]
-        direct_id_pattern = r'\[(\d{10,})\]'  # Long numeric IDs
-        
-        def replace_direct_id(match):
-            nonlocal replacements_made
-            calc_id = match.group(1)
-            if calc_id in calc_map:
-                replacements_made += 1
-                return f"[{calc_map[calc_id]}]"
-            return match.group(0)
-        
-        cleaned = re.sub(direct_id_pattern, replace_direct_id, cleaned)
-        
-        # Pattern 4: Check for any remaining unresolved calculation references
-        if replacements_made == 0 and re.search(r'\[Calculation_\d+\]|\[\d{10,}\]|@\{\d+\}', raw_formula):
-            status = "Unresolved References"
-        
-        # If we made replacements but there are still unresolved ones
-        if replacements_made > 0 and re.search(r'\[Calculation_\d+\]|\[\d{10,}\]|@\{\d+\}', cleaned):
+        # Resolve all three reference formats in a single scan
+        replace_id = _make_id_replacer(calc_map, counts)
+        cleaned = _ALL_RE.sub(replace_id, cleaned)
+        replacements_made, unresolved = counts
+        
+        # The scan already tallied unresolved references in the raw formula
+        if unresolved:
+            status = "Partially Resolved" if replacements_made else "Unresolved References"
+        
+        # Captions can themselves be calculation IDs (a column with no caption
+        # falls back to its [Calculation_N] name), so check what was substituted in
+        elif replacements_made and _ALL_RE.search(cleaned):
             status = "Partially Resolved"
     
     except Exception as e:
@@ -84,159 +114,210 @@ def clean_calculation_formula(raw_formula, calc_map):
     return cleaned, status
 
 
-def extract_all_data(root, filename):
-    """Extract all data from a Tableau workbook"""
-    data = {
-        'fields': [],
-        'calculations': {},
-        'field_worksheet_usage': [],
-        'connections': {}
-    }
+def _extract_datasource(ds, data, fields_by_key, field_captions):
+    """Extract connection info and fields from a <datasource> element
+
+    Fields are stored in fields_by_key under (datasource, field name); the first
+    definition of a field in a datasource is kept, along with its calculation
+    ID mapping, and later duplicates are skipped entirely.
+    """
+    # Values repeated on every field are interned so they share one object
+    ds_name = sys.intern(ds.get('name', ''))
+    ds_caption = ds.get('caption', ds_name)
     
-    # First pass: Build calculation ID to caption/alias mapping
-    calc_id_to_caption = {}
+    # Extract connection info
+    conn = next(ds.iter('connection'), None)
+    if conn is not None:
+        conn_class = conn.get('class', '')
+        conn_name = conn.get('server', conn.get('filename', conn.get('database', '')))
+        data['connections'][ds_name] = {
+            'name': conn_name,
+            'alias': ds_caption,
+            'class': conn_class
+        }
     
-    # Extract from columns with calculation elements
-    for col in root.findall('.//column'):
-        calc_elem = col.find('.//calculation')
+    # Extract columns/fields
+    for col in ds.iter('column'):
+        field_name = col.get('name', '')
+        key = (ds_name, field_name)
+        if key in fields_by_key:
+            continue
+        
+        field_caption = col.get('caption', field_name)
+        
+        # Check if this is a calculated field
+        calc_elem = next(col.iter('calculation'), None)
+        formula = ''
+        field_type = 'Dimension'  # Default
+        
         if calc_elem is not None:
+            formula = calc_elem.get('formula', '')
+            field_type = 'Calculated Field'
+            calc_class = calc_elem.get('class', '')
+            if 'tableau' in calc_class:
+                field_type = 'Table Calculation'
+            
+            # Also add this calculation ID mapping if it has one
             calc_id = calc_elem.get('id', '')
-            if calc_id:
-                # Use caption if available, otherwise use name
-                caption = col.get('caption', col.get('name', ''))
-                if caption:
-                    calc_id_to_caption[calc_id] = caption
-    
-    # Extract from standalone calculations
-    for calc in root.findall('.//calculation'):
-        calc_id = calc.get('id', '')
-        if calc_id:
-            # Use caption if available, otherwise use name
-            caption = calc.get('caption', calc.get('name', ''))
-            if caption:
-                calc_id_to_caption[calc_id] = caption
-    
-    # Store the mapping
-    data['calculations'] = calc_id_to_caption
-    
-    # Extract datasource information
-    for ds in root.findall('.//datasource'):
-        ds_name = ds.get('name', '')
-        ds_caption = ds.get('caption', ds_name)
-        
-        # Extract connection info
-        conn = ds.find('.//connection')
-        if conn is not None:
-            conn_class = conn.get('class', '')
-            conn_name = conn.get('server', conn.get('filename', conn.get('database', '')))
-            data['connections'][ds_name] = {
-                'name': conn_name,
-                'alias': ds_caption,
-                'class': conn_class
-            }
-        
-        # Extract columns/fields
-        for col in ds.findall('.//column'):
+            if calc_id and field_caption:
+                field_captions[calc_id] = field_caption
+        
+        # Determine field type based on role and aggregation
+        elif col.get('role') == 'measure':
+            field_type = 'Measure'
+            if col.get('aggregation'):
+                field_type = 'Aggregated Measure'
+        
+        fields_by_key[key] = {
+            'name': field_name,
+            'caption': field_caption,
+            'datatype': sys.intern(col.get('datatype', '')),
+            'role': sys.intern(col.get('role', '')),
+            'datasource': ds_name,
+            'formula': formula,
+            'field_type': field_type
+        }
+
+
+def _extract_worksheet(ws, data, seen_usage):
+    """Extract field usage from a <worksheet> element, skipping (field, worksheet)
+    pairs already recorded in seen_usage"""
+    ws_name = ws.get('name', '')
+    
+    # Get datasource dependencies
+    for dep in ws.iter('datasource-dependencies'):
+        ds_name = dep.get('datasource', '')
+        
+        for col in dep.iter('column'):
             field_name = col.get('name', '')
-            field_caption = col.get('caption', field_name)
-            
-            # Check if this is a calculated field
-            calc_elem = col.find('.//calculation')
-            formula = ''
-            field_type = 'Dimension'  # Default
-            
-            if calc_elem is not None:
-                formula = calc_elem.get('formula', '')
-                field_type = 'Calculated Field'
-                calc_class = calc_elem.get('class', '')
-                if 'tableau' in calc_class:
-                    field_type = 'Table Calculation'
+            if field_name:
+                key = (field_name, ws_name)
+                if key in seen_usage:
+                    continue
+                seen_usage.add(key)
                 
-                # Also add this calculation ID mapping if it has one
-                calc_id = calc_elem.get('id', '')
-                if calc_id and field_caption:
-                    data['calculations'][calc_id] = field_caption
-            
-            # Determine field type based on role and aggregation
-            elif col.get('role') == 'measure':
-                field_type = 'Measure'
-                if col.get('aggregation'):
-                    field_type = 'Aggregated Measure'
-            
-            data['fields'].append({
-                'name': field_name,
-                'caption': field_caption,
-                'datatype': col.get('datatype', ''),
-                'role': col.get('role', ''),
-                'datasource': ds_name,
-                'formula': formula,
-                'field_type': field_type
-            })
-    
-    # Extract standalone calculations that might not be in columns
-    for calc in root.findall('.//calculation'):
-        calc_name = calc.get('name', '')
-        calc_caption = calc.get('caption', calc_name)
-        formula = calc.get('formula', '')
-        
-        # Add to fields if not already there
-        if calc_name and not any(f['name'] == calc_name for f in data['fields']):
-            data['fields'].append({
-                'name': calc_name,
-                'caption': calc_caption,
-                'datatype': calc.get('datatype', ''),
-                'role': calc.get('role', ''),
-                'datasource': '',
-                'formula': formula,
-                'field_type': 'Calculated Field'
-            })
-    
-    # Extract field usage in worksheets
-    for ws in root.findall('.//worksheet'):
-        ws_name = ws.get('name', '')
-        
-        # Get datasource dependencies
-        for dep in ws.findall('.//datasource-dependencies'):
-            ds_name = dep.get('datasource', '')
-            
-            for col in dep.findall('.//column'):
-                field_name = col.get('name', '')
-                if field_name:
-                    data['field_worksheet_usage'].append({
-                        'field': field_name,
-                        'worksheet': ws_name,
-                        'datasource': ds_name
-                    })
-        
-        # Also check for fields in encodings
-        for enc_col in ws.findall('.//encoding//column'):
+                data['field_worksheet_usage'].append({
+                    'field': field_name,
+                    'worksheet': ws_name,
+                    'datasource': ds_name
+                })
+    
+    # Also check for fields in encodings
+    for enc in ws.iter('encoding'):
+        for enc_col in enc.iter('column'):
             field_ref = enc_col.text or enc_col.get('column', '')
             if field_ref:
                 # Remove brackets if present
                 if field_ref.startswith('[') and field_ref.endswith(']'):
                     field_ref = field_ref[1:-1]
                 
+                key = (field_ref, ws_name)
+                if key in seen_usage:
+                    continue
+                seen_usage.add(key)
+                
                 data['field_worksheet_usage'].append({
                     'field': field_ref,
                     'worksheet': ws_name,
                     'datasource': ''
                 })
+
+
+def extract_all_data(source, filename):
+    """Extract all data from a Tableau workbook in a single streaming XML pass"""
+    data = {
+        'fields': [],
+        'calculations': {},
+        'field_worksheet_usage': [],
+        'connections': {}
+    }
+    
+    # Calculation ID to caption/alias mappings, kept apart so they can be
+    # merged in order of precedence once the whole document has been read
+    column_captions = {}  # caption of a column holding the calculation
+    calc_captions = {}    # caption/name set on the calculation itself
+    field_captions = {}   # caption of the datasource field defining it
+    fields_by_key = {}    # (datasource, field name) -> field
+    standalone_calcs = []
+    seen_usage = set()    # (field, worksheet) pairs already in field_worksheet_usage
+    open_columns = []     # [caption, seen_calculation] for each column being read
+    depth = 0             # nesting depth of the element being read; the root is 1
+    
+    # Elements are handled on their end event, once all their children are
+    # available. Datasources, worksheets and every direct child of the root
+    # (thumbnails, windows, dashboards, ...) are cleared once read to free memory.
+    # Start events track nesting depth and the enclosing columns of each calculation.
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        tag = elem.tag
+        
+        if event == 'start':
+            depth += 1
+            if tag == 'column':
+                # Use caption if available, otherwise use name
+                open_columns.append([elem.get('caption', elem.get('name', '')), False])
+            continue
+        
+        depth -= 1
+        
+        if tag == 'column':
+            open_columns.pop()
+        
+        elif tag == 'calculation':
+            calc_id = elem.get('id', '')
+            calc_name = elem.get('name', '')
+            # Use caption if available, otherwise use name
+            caption = elem.get('caption', calc_name)
+            if calc_id and caption:
+                calc_captions[calc_id] = caption
+            
+            # The first calculation in a column also maps to the column's caption
+            if open_columns and not open_columns[-1][1]:
+                open_columns[-1][1] = True
+                column_caption = open_columns[-1][0]
+                if calc_id and column_caption:
+                    column_captions[calc_id] = column_caption
+            
+            # Keep named calculations that might not be in columns
+            if calc_name:
+                standalone_calcs.append({
+                    'name': calc_name,
+                    'caption': caption,
+                    'datatype': sys.intern(elem.get('datatype', '')),
+                    'role': sys.intern(elem.get('role', '')),
+                    'datasource': '',
+                    'formula': elem.get('formula', ''),
+                    'field_type': 'Calculated Field'
+                })
+        
+        elif tag == 'datasource':
+            _extract_datasource(elem, data, fields_by_key, field_captions)
+            elem.clear()
+        
+        elif tag == 'worksheet':
+            _extract_worksheet(elem, data, seen_usage)
+            elem.clear()
+        
+        # Nothing else needs a top-level subtree once it has ended
+        if depth == 1:
+            elem.clear()
     
-    # Remove duplicates from field_worksheet_usage
-    seen = set()
-    unique_usage = []
-    for usage in data['field_worksheet_usage']:
-        key = (usage['field'], usage['worksheet'])
-        if key not in seen:
-            seen.add(key)
-            unique_usage.append(usage)
-    data['field_worksheet_usage'] = unique_usage
+    # Add standalone calculations to fields if not already there
+    field_names = {name for _, name in fields_by_key}
+    for calc in standalone_calcs:
+        if calc['name'] not in field_names:
+            field_names.add(calc['name'])
+            fields_by_key[('', calc['name'])] = calc
+    data['fields'] = list(fields_by_key.values())
+    
+    # Datasource fields take precedence over calculation captions, which in
+    # turn take precedence over captions of columns using the calculation
+    data['calculations'] = {**column_captions, **calc_captions, **field_captions}
     
     return data
 
 
 def build_final_output(all_workbook_data):
-    """Build the final output matching the sample format"""
+    """Build the final output rows, as OutputRow tuples in OUTPUT_COLUMNS order"""
     final_rows = []
     column_id = 1
     
@@ -244,22 +325,25 @@ def build_final_output(all_workbook_data):
         # Create calculation map for this workbook
         calc_map = data['calculations']
         
-        # Get all fields
-        fields_by_name = {f['name']: f for f in data['fields']}
-        
         # Get worksheet usage
-        usage_by_field = {}
+        usage_by_field = defaultdict(list)
         for usage in data['field_worksheet_usage']:
-            field = usage['field']
-            if field not in usage_by_field:
-                usage_by_field[field] = []
-            usage_by_field[field].append(usage['worksheet'])
+            usage_by_field[usage['field']].append(usage['worksheet'])
+        
+        # Cleaned formulas, keyed by raw formula; calc_map is fixed for the workbook
+        cleaned_cache = {}
         
         # Process each field
         for field in data['fields']:
             field_name = field['name']
             worksheets = usage_by_field.get(field_name, [''])
             
+            # Per-field values, looked up once rather than for every worksheet row
+            caption = field.get('caption', '')
+            field_type = field.get('field_type', '')
+            datatype = field.get('datatype', '')
+            role = field.get('role', '')
+            
             # Get connection info
             conn_info = data['connections'].get(field['datasource'], {})
             conn_name = conn_info.get('name', '')
@@ -271,7 +355,11 @@ def build_final_output(all_workbook_data):
             clean_status = 'No Calculation'
             
             if original_formula:
-                cleaned_formula, clean_status = clean_calculation_formula(original_formula, calc_map)
+                result = cleaned_cache.get(original_formula)
+                if result is None:
+                    result = clean_calculation_formula(original_formula, calc_map)
+                    cleaned_cache[original_formula] = result
+                cleaned_formula, clean_status = result
             
             # Create one row per worksheet (or one row if not used in any worksheet)
             if not worksheets:
@@ -281,46 +369,106 @@ def build_final_output(all_workbook_data):
                 # Determine if field is used in this worksheet
                 field_used = 'Yes' if worksheet else 'No'
                 
-                final_rows.append({
-                    'Column ID': column_id,
-                    'Column Name': field_name,
-                    'Column Alias': field.get('caption', ''),
-                    'Field Type': field.get('field_type', ''),
-                    'Connection Name': conn_name,
-                    'Connection Alias': conn_alias,
-                    'datatype': field.get('datatype', ''),
-                    'role': field.get('role', ''),
-                    'Calculation Formula': cleaned_formula,
-                    'Original Calculation': original_formula,
-                    'Calc Clean Status': clean_status,
-                    'Field Used in Worksheets': field_used,
-                    'Worksheet Name': worksheet,
-                    'File Name': filename
-                })
+                final_rows.append(OutputRow(
+                    column_id,
+                    field_name,
+                    caption,
+                    field_type,
+                    conn_name,
+                    conn_alias,
+                    datatype,
+                    role,
+                    cleaned_formula,
+                    original_formula,
+                    clean_status,
+                    field_used,
+                    worksheet,
+                    filename
+                ))
                 column_id += 1
     
     return final_rows
 
 
+def _iter_tableau_files(directory):
+    """Yield paths of .twb/.twbx files under directory, in os.walk order"""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # DirEntry caches the file type from readdir, so no extra stat is needed
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # Like os.walk, do not descend into symlinked directories, and
+                    # treat an entry whose link status cannot be read as not walkable
+                    try:
+                        walk_into = not entry.is_symlink()
+                    except OSError:
+                        walk_into = False
+                    if walk_into:
+                        subdirs.append(entry.path)
+                elif entry.name.lower().endswith(('.twb', '.twbx')):
+                    yield entry.path
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+    
+    for subdir in subdirs:
+        yield from _iter_tableau_files(subdir)
+
+
+def _process_one(filepath):
+    """Extract data from a single Tableau file (runs in a worker process)"""
+    filename = os.path.basename(filepath)
+    with open_twb(filepath) as source:
+        return filename, extract_all_data(source, filename)
+
+
+def _record_result(all_workbook_data, filepath, get_result):
+    """Store one workbook's data, reporting a failure without stopping the run"""
+    try:
+        filename, data = get_result()
+        print(f"Processed {filename}")
+        all_workbook_data[filename] = data
+        
+    except Exception as e:
+        print(f"Error processing {os.path.basename(filepath)}: {str(e)}")
+
+
 def process_all_files(input_dir):
     """Process all Tableau files in the input directory"""
     all_workbook_data = {}
     
-    for root_dir, _, files in os.walk(input_dir):
-        for f in files:
-            if f.lower().endswith(('.twb', '.twbx')):
-                try:
-                    filepath = os.path.join(root_dir, f)
-                    tree, filename = extract_twb_tree(filepath)
-                    root = tree.getroot()
-                    
-                    print(f"Processing {filename}...")
-                    data = extract_all_data(root, filename)
-                    all_workbook_data[filename] = data
-                    
-                except Exception as e:
-                    print(f"Error processing {f}: {str(e)}")
-                    continue
+    filepaths = list(_iter_tableau_files(input_dir))
+    
+    if not filepaths:
+        return all_workbook_data
+    
+    # A single workbook is parsed inline; a worker process would only add
+    # start-up and pickling overhead
+    if len(filepaths) == 1:
+        _record_result(all_workbook_data, filepaths[0], lambda: _process_one(filepaths[0]))
+        return all_workbook_data
+    
+    # Workbooks are independent, so parse them in parallel; results are
+    # collected in discovery order to keep the output stable
+    max_workers = min(len(filepaths), os.cpu_count() or 1)
+    if sys.platform == 'win32':
+        # ProcessPoolExecutor rejects an explicit max_workers above 61 on Windows
+        max_workers = min(max_workers, 61)
+    
+    # The GUI calls this from a worker thread, and forking a multi-threaded
+    # process can deadlock the child, so workers are always spawned fresh
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [executor.submit(_process_one, filepath) for filepath in filepaths]
+        
+        for filepath, future in zip(filepaths, futures):
+            _record_result(all_workbook_data, filepath, future.result)
     
     return all_workbook_data
 
@@ -333,27 +481,10 @@ def write_final_csv(output_dir, final_rows):
     
     output_path = os.path.join(output_dir, 'tableau_metadata.csv')
     
-    # Define column order to match sample
-    fieldnames = [
-        'Column ID',
-        'Column Name', 
-        'Column Alias',
-        'Field Type',
-        'Connection Name',
-        'Connection Alias',
-        'datatype',
-        'role',
-        'Calculation Formula',
-        'Original Calculation',
-        'Calc Clean Status',
-        'Field Used in Worksheets',
-        'Worksheet Name',
-        'File Name'
-    ]
-    
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    # A large buffer keeps write syscalls infrequent on big outputs
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+        writer = csv.writer(f)
+        writer.writerow(OUTPUT_COLUMNS)
         writer.writerows(final_rows)
     
     print(f"Wrote {len(final_rows)} rows to {output_path}")
@@ -361,6 +492,20 @@ def write_final_csv(output_dir, final_rows):
 
 # --- GUI Application ---
 
+class LogRedirect:
+    """File-like stdout replacement that forwards printed lines to a log function"""
+    def __init__(self, log_func):
+        self.log_func = log_func
+    
+    def write(self, text):
+        text = text.strip()
+        if text:
+            self.log_func(text)
+    
+    def flush(self):
+        pass
+
+
 class TableauMetadataExtractor(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -419,6 +564,11 @@ class TableauMetadataExtractor(tk.Tk):
         self.log_text = tk.Text(log_frame, height=10, wrap='word', yscrollcommand=scrollbar.set)
         self.log_text.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.log_text.yview)
+        
+        # Log messages queued by the worker thread, drained on the Tk thread
+        self._log_queue = deque()
+        self._worker = None
+        self._outcome = None
     
     def browse_input(self):
         folder = filedialog.askdirectory(title='Select Input Folder')
@@ -431,9 +581,31 @@ class TableauMetadataExtractor(tk.Tk):
             self.output_path.set(folder)
     
     def log(self, message):
-        self.log_text.insert('end', f"{message}\n")
-        self.log_text.see('end')
-        self.update()
+        # Safe to call from the worker thread; _drain_log shows queued messages
+        self._log_queue.append(message)
+    
+    def _drain_log(self):
+        """Insert queued log messages in one batch, polling until the worker is done"""
+        # Check before draining so messages logged just before exit are not missed
+        done = not self._worker.is_alive()
+        
+        batch = []
+        while self._log_queue:
+            batch.append(self._log_queue.popleft())
+        if batch:
+            self.log_text.insert('end', '\n'.join(batch) + '\n')
+            self.log_text.see('end')
+        
+        if not done:
+            self.after(100, self._drain_log)
+            return
+        
+        # Re-enable button
+        self.process_btn.config(state='normal')
+        
+        if self._outcome:
+            show, title, message = self._outcome
+            show(title, message)
     
     def process_files(self):
         input_dir = self.input_path.get()
@@ -452,35 +624,31 @@ class TableauMetadataExtractor(tk.Tk):
         self.log_text.delete(1.0, 'end')
         self.log('Starting metadata extraction...')
         
+        # Disable button during processing
+        self.process_btn.config(state='disabled')
+        
+        # Run the extraction in the background so the Tk mainloop keeps pumping
+        self._outcome = None
+        self._worker = threading.Thread(target=self._run_extraction,
+                                        args=(input_dir, output_dir), daemon=True)
+        self._worker.start()
+        self.after(100, self._drain_log)
+    
+    def _run_extraction(self, input_dir, output_dir):
+        """Worker thread body; must not touch Tk widgets directly"""
+        # Redirect print to log
+        old_stdout = sys.stdout
+        sys.stdout = LogRedirect(self.log)
+        
         try:
-            # Disable button during processing
-            self.process_btn.config(state='disabled')
-            
-            # Redirect print to log
-            import sys
-            from io import StringIO
-            
-            class LogRedirect:
-                def __init__(self, log_func):
-                    self.log_func = log_func
-                
-                def write(self, text):
-                    if text.strip():
-                        self.log_func(text.strip())
-                
-                def flush(self):
-                    pass
-            
-            old_stdout = sys.stdout
-            sys.stdout = LogRedirect(self.log)
-            
             # Process files
             self.log('Scanning for Tableau files...')
             all_data = process_all_files(input_dir)
             
             if not all_data:
                 self.log('No Tableau files found!')
-                messagebox.showwarning('Warning', 'No Tableau files found in the input folder')
+                self._outcome = (messagebox.showwarning, 'Warning',
+                                 'No Tableau files found in the input folder')
                 return
             
             self.log(f'Found {len(all_data)} Tableau file(s)')
@@ -491,22 +659,21 @@ class TableauMetadataExtractor(tk.Tk):
             self.log('Writing output CSV...')
             write_final_csv(output_dir, final_rows)
             
-            # Restore stdout
-            sys.stdout = old_stdout
-            
             self.log('Extraction completed successfully!')
-            messagebox.showinfo('Success', f'Metadata extraction completed!\nOutput saved to: {os.path.join(output_dir, "tableau_metadata.csv")}')
+            self._outcome = (messagebox.showinfo, 'Success',
+                             f'Metadata extraction completed!\nOutput saved to: {os.path.join(output_dir, "tableau_metadata.csv")}')
             
         except Exception as e:
-            sys.stdout = old_stdout
             self.log(f'Error: {str(e)}')
-            messagebox.showerror('Error', f'An error occurred: {str(e)}')
+            self._outcome = (messagebox.showerror, 'Error', f'An error occurred: {str(e)}')
         
         finally:
-            # Re-enable button
-            self.process_btn.config(state='normal')
+            # Restore stdout
+            sys.stdout = old_stdout
 
 
 if __name__ == '__main__':
+    # Lets frozen builds start pool workers instead of relaunching the GUI
+    multiprocessing.freeze_support()
     app = TableauMetadataExtractor()
     app.mainloop()